@@ -1,8 +1,12 @@
+import asyncio
 import os
-import shutil
 import tempfile
+import uuid
 from contextlib import asynccontextmanager
+from itertools import count
 
+import aiofiles
+import orjson
 from fastapi import (
     Depends,
     FastAPI,
@@ -10,6 +14,7 @@ from fastapi import (
     Form,
     HTTPException,
     Query,
+    Response,
     UploadFile,
     status,
 )
@@ -19,111 +24,134 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.db import Post, create_db_and_tables, get_async_session
 from app.images import imagekit
 from app.schemas import PostCreate, PostResponse
+from app.seed import text_posts
+
+
+# orjson-dumped OpenAPI schema, built once at startup.
+_openapi_bytes: bytes | None = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global _openapi_bytes
+
     await create_db_and_tables()
+    # Build the OpenAPI schema now instead of on the first /docs request.
+    app.openapi_schema = app.openapi()
+    _openapi_bytes = dumps(app.openapi_schema)
     yield
 
 
 app = FastAPI(lifespan=lifespan)
 
+# Replace the default /openapi.json route with one serving the cached bytes.
+app.router.routes = [
+    route for route in app.router.routes if getattr(route, "path", None) != "/openapi.json"
+]
 
-text_posts = {
-    1: {
-        "title": "Getting Started with FastAPI",
-        "content": "FastAPI is a modern, fast web framework for building APIs with Python. It is easy to learn and very powerful.",
-    },
-    2: {
-        "title": "Why Use Python for Web APIs",
-        "content": "Python offers a clean syntax, a huge ecosystem of libraries, and excellent community support for backend development.",
-    },
-    3: {
-        "title": "Understanding RESTful Endpoints",
-        "content": "RESTful APIs are based on standard HTTP methods such as GET, POST, PUT, and DELETE to manage resources.",
-    },
-    4: {
-        "title": "FastAPI vs Flask",
-        "content": "While Flask is lightweight and flexible, FastAPI provides built-in data validation and automatic API documentation.",
-    },
-    5: {
-        "title": "Working with Path Parameters",
-        "content": "Path parameters allow you to pass dynamic values in the URL and are commonly used to identify specific resources.",
-    },
-    6: {
-        "title": "Using Query Parameters Effectively",
-        "content": "Query parameters are useful for filtering, sorting, and paginating API responses without changing the endpoint path.",
-    },
-    7: {
-        "title": "Request Validation with Pydantic",
-        "content": "Pydantic models ensure that incoming request data is validated and parsed correctly before reaching your logic.",
-    },
-    8: {
-        "title": "Handling Errors Gracefully",
-        "content": "Proper error handling improves user experience by returning clear messages and appropriate HTTP status codes.",
-    },
-    9: {
-        "title": "Automatic API Documentation",
-        "content": "FastAPI automatically generates interactive API documentation using Swagger UI and ReDoc.",
-    },
-    10: {
-        "title": "Deploying a FastAPI Application",
-        "content": "You can deploy FastAPI apps using tools like Uvicorn, Docker, and cloud platforms such as AWS or Azure.",
-    },
-}
+
+@app.get("/openapi.json", include_in_schema=False)
+async def serve_openapi() -> Response:
+    body = _openapi_bytes if _openapi_bytes is not None else dumps(app.openapi())
+    return Response(body, media_type="application/json")
+
+_ORJSON_OPTS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+def _orjson_default(obj):
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(obj) -> bytes:
+    """Serialize with the module-wide orjson options and default handler."""
+    return orjson.dumps(obj, default=_orjson_default, option=_ORJSON_OPTS)
+
+
+class ORJSONResp(Response):
+    """JSON response rendered with orjson, skipping FastAPI's jsonable_encoder.
+
+    Datetimes are serialized natively (naive values treated as UTC with a
+    ``Z`` suffix); UUIDs go through the shared ``default`` handler.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+# id -> position in text_posts; seed posts get ids 1..N in insertion order.
+_post_index: dict[int, int] = {i + 1: i for i in range(len(text_posts))}
+
+# O(1) id allocation; count.__next__ is atomic under the GIL.
+_next_id = count(len(text_posts) + 1)
+
+# Pre-serialized /posts pages keyed by limit, invalidated on every write.
+_posts_cache: dict[int, bytes] = {}
 
 
 @app.get(
     "/posts",
-    response_model=list[PostResponse],
     summary="Get a list of posts",
     tags=["Posts"],
+    response_class=ORJSONResp,
+    responses={200: {"model": list[PostResponse]}},
 )
-def get_posts(
+async def get_posts(
     limit: int = Query(
         10,
         ge=1,
         le=100,
         description="Maximum number of posts to return.",
     ),
-) -> list[PostResponse]:
-    return [PostResponse(**post) for post in list(text_posts.values())[:limit]]
+) -> Response:
+    body = _posts_cache.get(limit)
+    if body is None:
+        body = dumps(text_posts[:limit])
+        _posts_cache[limit] = body
+    return Response(body, media_type="application/json")
 
 
 @app.post(
     "/posts",
-    response_model=PostResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create a new post.",
     tags=["Posts"],
+    response_class=ORJSONResp,
+    responses={201: {"model": PostResponse}},
 )
-def create_post(post: PostCreate) -> PostResponse:
-    new_post = PostResponse(
+async def create_post(post: PostCreate) -> ORJSONResp:
+    new_post = PostResponse.model_construct(
         title=post.title,
         content=post.content,
     )
-    text_posts[max(text_posts.keys()) + 1] = new_post.model_dump()
-    return new_post
+    post_data = new_post.model_dump(mode="json", exclude_none=True)
+    _post_index[next(_next_id)] = len(text_posts)
+    text_posts.append(post_data)
+    _posts_cache.clear()
+    return ORJSONResp(post_data, status_code=status.HTTP_201_CREATED)
 
 
 @app.get(
     "/posts/{id}",
-    response_model=PostResponse,
     summary="Get a post by ID.",
     tags=["Posts"],
+    response_class=ORJSONResp,
     responses={
+        200: {"model": PostResponse},
         404: {
             "description": "Post not found",
             "content": {"application/json": {"example": {"detail": "Post not found."}}},
         }
     },
 )
-def get_post(id: int):
-    if id not in text_posts:
+async def get_post(id: int) -> ORJSONResp:
+    if id not in _post_index:
         raise HTTPException(status_code=404, detail="Post not found.")
 
-    return text_posts.get(id)
+    return ORJSONResp(text_posts[_post_index[id]])
 
 
 @app.post(
@@ -142,13 +170,22 @@ async def upload_file(
             delete=False, suffix=os.path.splitext(file.filename)[1]
         ) as temp_file:
             temp_file_path = temp_file.name
-            shutil.copyfileobj(file.file, temp_file)
 
-        upload_result = imagekit.files.upload(
-            file=open(temp_file_path, "rb"),
-            file_name=file.filename,
-            tags=["backend", "fastapi"],
-        )
+        # Stream in 1 MiB chunks so peak memory stays O(chunk) and the
+        # event loop keeps yielding between reads.
+        async with aiofiles.open(temp_file_path, "wb") as out_file:
+            while chunk := await file.read(1 << 20):
+                await out_file.write(chunk)
+
+        # The ImageKit SDK is synchronous; run it in a worker thread so the
+        # upload doesn't block the event loop.
+        with open(temp_file_path, "rb") as upload_source:
+            upload_result = await asyncio.to_thread(
+                imagekit.files.upload,
+                file=upload_source,
+                file_name=file.filename,
+                tags=["backend", "fastapi"],
+            )
 
         new_post = Post(
             caption=caption,
@@ -175,25 +212,33 @@ async def upload_file(
     "/files",
     summary="Get a list of uploaded files.",
     tags=["Files"],
+    response_class=ORJSONResp,
 )
 async def get_files(
+    limit: int = Query(
+        50,
+        ge=1,
+        le=500,
+        description="Maximum number of files to return.",
+    ),
+    offset: int = Query(
+        0,
+        ge=0,
+        description="Number of files to skip.",
+    ),
     session: AsyncSession = Depends(get_async_session),
 ):
-    result = await session.execute(select(Post).order_by(Post.created_at.desc()))
-    posts = [row[0] for row in result.all()]
-
-    posts_data = []
-    for post in posts:
-        posts_data.append(
-            {
-                "id": str(post.id),
-                "caption": post.caption,
-                "url": post.url,
-                "file_type": post.file_type,
-                "file_name": post.file_name,
-                "created_at": post.created_at.isoformat(),
-            }
+    result = await session.execute(
+        select(
+            Post.id,
+            Post.caption,
+            Post.url,
+            Post.file_type,
+            Post.file_name,
+            Post.created_at,
         )
-    return {
-        "posts": posts_data,
-    }
+        .order_by(Post.created_at.desc())
+        .limit(limit)
+        .offset(offset)
+    )
+    return ORJSONResp({"posts": [dict(row) for row in result.mappings()]})
@@ -1,11 +1,15 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class PostCreate(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     title: str
     content: str
 
 
 class PostResponse(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     title: str
     content: str
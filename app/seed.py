@@ -0,0 +1,42 @@
+text_posts: list[dict] = [
+    {
+        "title": "Getting Started with FastAPI",
+        "content": "FastAPI is a modern, fast web framework for building APIs with Python. It is easy to learn and very powerful.",
+    },
+    {
+        "title": "Why Use Python for Web APIs",
+        "content": "Python offers a clean syntax, a huge ecosystem of libraries, and excellent community support for backend development.",
+    },
+    {
+        "title": "Understanding RESTful Endpoints",
+        "content": "RESTful APIs are based on standard HTTP methods such as GET, POST, PUT, and DELETE to manage resources.",
+    },
+    {
+        "title": "FastAPI vs Flask",
+        "content": "While Flask is lightweight and flexible, FastAPI provides built-in data validation and automatic API documentation.",
+    },
+    {
+        "title": "Working with Path Parameters",
+        "content": "Path parameters allow you to pass dynamic values in the URL and are commonly used to identify specific resources.",
+    },
+    {
+        "title": "Using Query Parameters Effectively",
+        "content": "Query parameters are useful for filtering, sorting, and paginating API responses without changing the endpoint path.",
+    },
+    {
+        "title": "Request Validation with Pydantic",
+        "content": "Pydantic models ensure that incoming request data is validated and parsed correctly before reaching your logic.",
+    },
+    {
+        "title": "Handling Errors Gracefully",
+        "content": "Proper error handling improves user experience by returning clear messages and appropriate HTTP status codes.",
+    },
+    {
+        "title": "Automatic API Documentation",
+        "content": "FastAPI automatically generates interactive API documentation using Swagger UI and ReDoc.",
+    },
+    {
+        "title": "Deploying a FastAPI Application",
+        "content": "You can deploy FastAPI apps using tools like Uvicorn, Docker, and cloud platforms such as AWS or Azure.",
+    },
+]
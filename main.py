@@ -1,4 +1,18 @@
+import os
+
 import uvicorn
 
 if __name__ == "__main__":
-    uvicorn.run("app.app:app", host="0.0.0.0", port=8000, reload=True)
+    # RELOAD=1 enables the auto-reloader for development; uvicorn can't
+    # combine it with multiple workers, so reload forces a single process.
+    reload = os.environ.get("RELOAD") == "1"
+    workers = 1 if reload else int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
+    uvicorn.run(
+        "app.app:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=reload,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+    )